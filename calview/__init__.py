@@ -15,20 +15,20 @@ Required are:
 If required files are not present, they are not present, create them:
   by copying calview.settings.TEMPLATE_FILE_NAME in
   calview.settings.DATA_DIR to calview.settings.CONFIG_DIR
-  by creating the settings file according to SETTINGS_DEFAULTS.
+  by writing calview.settings.SETTINGS_DEFAULT_TEXT to the settings
+  file.
 
 """
 
 import os
-import sys
+import pathlib
 import shutil
-import configparser
 from calview.settings import (CONFIG_DIR, DATA_DIR,
                               TEMPLATE_FILE_NAME,
                               SETTINGS_FILE_NAME,
                               TEMPLATE_PATH,
                               SETTINGS_PATH,
-                              SETTINGS_DEFAULTS,
+                              SETTINGS_DEFAULT_TEXT,
                               SETTINGS_HELPMSG)
 
 
@@ -39,21 +39,26 @@ def _setup_calview() -> None:
     site effects, as __init__ is senitive.
 
     """
-    if not os.path.isdir(CONFIG_DIR):
+    # one directory listing instead of a stat call per required file
+    try:
+        with os.scandir(CONFIG_DIR) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
         os.mkdir(CONFIG_DIR)
-    if not os.path.isfile(TEMPLATE_PATH):
-        shutil.copy(os.path.join(DATA_DIR, TEMPLATE_FILE_NAME),
-                    CONFIG_DIR)
-    if not os.path.isfile(SETTINGS_PATH):
-        config = configparser.ConfigParser()
-        config.read_dict(SETTINGS_DEFAULTS)
-        with open(SETTINGS_PATH, 'w') as file:
-            file.write(SETTINGS_HELPMSG)
-            config.write(file)
+        present = set()
+    if TEMPLATE_FILE_NAME in present and SETTINGS_FILE_NAME in present:
+        return
+    if TEMPLATE_FILE_NAME not in present:
+        # copyfile: there is no file metadata worth copying
+        shutil.copyfile(os.path.join(DATA_DIR, TEMPLATE_FILE_NAME),
+                        TEMPLATE_PATH)
+    if SETTINGS_FILE_NAME not in present:
+        pathlib.Path(SETTINGS_PATH).write_text(
+            SETTINGS_HELPMSG + SETTINGS_DEFAULT_TEXT, encoding='utf-8')
 
 
 _setup_calview()
 
 # add CONFIG_DIR to this modules' namespace
-if os.path.exists(CONFIG_DIR):
+if os.path.isdir(CONFIG_DIR):
     __path__.append(CONFIG_DIR)
@@ -8,39 +8,97 @@ Usage:
 
 """
 import argparse
+import functools
+import os
+import re
+import types
+import typing
 import calview
 import calview.helper
 import calview.validation
 
 
-def _get_cli_parser(settings: calview.settings.ReadSettings,
-                    description: str, cli_options: list
+# if set to "1", only the first invalid cli argument is reported
+FAST_FAIL_ENV_VARIABLE = 'CALVIEW_FAST_FAIL'
+
+# matches the settings referenced in CLI_DESCRIPTION / CLI_OPTIONS,
+# e.g. "day_span" in "{settings.day_span}"
+_SETTINGS_REF_RE = re.compile(r'{settings\.(\w+)')
+
+
+def _get_referenced_settings() -> tuple:
+    """Get the names of all settings that calview.settings.CLI_DESCRIPTION
+    and the help strings in calview.settings.CLI_OPTIONS refer to.
+
+    Returns:
+        Sorted names of the referenced settings
+
+    """
+    texts = [calview.settings.CLI_DESCRIPTION]
+    texts.extend(options.get('help', '')
+                 for _, options in calview.settings.CLI_OPTIONS)
+    return tuple(sorted(set(_SETTINGS_REF_RE.findall(''.join(texts)))))
+
+
+_REFERENCED_SETTINGS = _get_referenced_settings()
+
+
+@functools.lru_cache(maxsize=2)
+def _get_formatted_cli(settings_values: tuple) -> tuple:
+    """Format calview.settings.CLI_DESCRIPTION and the help strings in
+    calview.settings.CLI_OPTIONS.
+
+    The result is cached, as it only depends on `settings_values`.
+    Neither calview.settings.CLI_DESCRIPTION nor
+    calview.settings.CLI_OPTIONS are changed.
+
+    Args:
+        settings_values: (name, value) pairs of the settings listed in
+        _REFERENCED_SETTINGS
+
+    Returns:
+        Tuple with the following elements:
+            (1) formatted description
+            (2) formatted cli options (same structure as
+            calview.settings.CLI_OPTIONS)
+
+    """
+    settings = types.SimpleNamespace(**dict(settings_values))
+    description = calview.settings.CLI_DESCRIPTION
+    if '{settings' in description:
+        description = description.format(settings=settings)
+    cli_options = list()
+    for command, options in calview.settings.CLI_OPTIONS:
+        if '{settings' in options.get('help', ''):
+            formatted = options['help'].format(settings=settings)
+            options = dict(options, help=formatted)
+        cli_options.append((command, options))
+    return description, tuple(cli_options)
+
+
+def _get_cli_parser(description: str, cli_options: typing.Sequence
                     ) -> argparse.ArgumentParser:
     """Setup CLI with description and arguments.
 
     Args:
-        settings: preliminary settings (as read from
-        calview.settings.SETTINGS_PATH)
-        description: CLI description (displayed in "--help")
-        arguments: nested list (see calview.settings.CLI_OPTIONS
-        for further information regardings its structure)
+        description: CLI description (displayed in "--help"), already
+        formatted
+        arguments: nested tuple (see calview.settings.CLI_OPTIONS
+        for further information regardings its structure), with
+        formatted help strings
 
     Returns:
         Set-up parser
 
     """
-    description = description.format(settings=settings)
     parser = argparse.ArgumentParser(description=description)
-    for option in cli_options:
-        if 'help' in option[1].keys():
-            formatted = option[1]['help'].format(settings=settings)
-            option[1]['help'] = formatted
-        parser.add_argument(*option[0], **option[1])
+    for command, options in cli_options:
+        parser.add_argument(*command, **options)
     return parser
 
 
-def _validate(settings: calview.settings.ReadSettings, cli_args: dict
-              ) -> None:
+def _validate(settings: calview.settings.ReadSettings, cli_args: dict,
+              *, fast_fail: bool = False) -> None:
     """Validates cli_args.
 
     Validation is done as specified in calview.validation.CLI_CHECKS.
@@ -51,6 +109,8 @@ def _validate(settings: calview.settings.ReadSettings, cli_args: dict
         settings: preliminary settings (as read from
         calview.settings.SETTINGS_PATH)
         cli_args: parsed command line arguments
+        fast_fail = False: If True, stop at the first invalid argument
+        (i.e. report only this one)
 
     Raises:
         SystemExit: If invalid settings are found (indirectly via
@@ -58,13 +118,13 @@ def _validate(settings: calview.settings.ReadSettings, cli_args: dict
 
     """
     quitmsgs = list()
+    quitmsgs_append = quitmsgs.append
 
-    for check in calview.validation.CLI_CHECKS:
-        call_check = check[0]
-        invalid_msg = check[1]
+    for call_check, invalid_msg in calview.validation.CLI_CHECKS:
         if call_check(cli_args):
-            invalid_msg = invalid_msg.format(**cli_args)
-            quitmsgs.append(invalid_msg)
+            quitmsgs_append(invalid_msg.format(**cli_args))
+            if fast_fail:
+                break
     total = len(quitmsgs)
     if total > 0:
         if total == 1:
@@ -87,6 +147,9 @@ def get_arguments(settings: calview.settings.ReadSettings) -> dict:
     This is done by using the parser obtained by
     _get_cli_parser
 
+    If the environment variable FAST_FAIL_ENV_VARIABLE is set to "1",
+    only the first invalid argument is reported.
+
     Args:
         settings: preliminary settings (as read from
         calview.settings.SETTINGS_PATH)
@@ -95,8 +158,10 @@ def get_arguments(settings: calview.settings.ReadSettings) -> dict:
         Parsed command line arguments
 
     """
-    parser = _get_cli_parser(settings, calview.settings.CLI_DESCRIPTION,
-                             calview.settings.CLI_OPTIONS)
+    settings_values = tuple((name, getattr(settings, name))
+                            for name in _REFERENCED_SETTINGS)
+    parser = _get_cli_parser(*_get_formatted_cli(settings_values))
     cli_args = vars(parser.parse_args())
-    _validate(settings, cli_args)
+    fast_fail = os.getenv(FAST_FAIL_ENV_VARIABLE) == '1'
+    _validate(settings, cli_args, fast_fail=fast_fail)
     return cli_args
@@ -8,25 +8,45 @@ Basic setup:
     preliminary_settings = read_settings()
     final_config = get_configuration(settings, cli_args)
     setup_logging(settings)
+    final_config = setup_locale(final_config)
 
 Other functions:
     get_password(settings)
 
 """
-import configparser
-import getpass
-import locale
+import copy
+import dataclasses
 import logging
 import sys
 import os
+import re
+import typing
 import datetime
-import caldav
 import calview.settings
 import calview.helper
+import calview.validation
+
+if typing.TYPE_CHECKING:
+    # only imported for type hints; see get_calendar_setup()
+    import caldav  # pylint: disable=unused-import
+
+# matches a section header, e.g. "[SETTINGS]"
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+# matches a "key = value" or "key: value" pair
+_KV_RE = re.compile(r'^([^=:\s][^=:]*?)\s*[=:]\s*(.*)$')
+# accepted boolean values (as in configparser)
+_BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                   '0': False, 'no': False, 'false': False, 'off': False}
+# section name of the settings file is the first key of SETTINGS_DEFAULTS
+_DEFAULT_SECTION = next(iter(calview.settings.SETTINGS_DEFAULTS))
+# local timezone; computed once, as calview runs only briefly
+_LOCAL_TZ = datetime.datetime.now().astimezone().tzinfo
+# (modification time of the settings file, settings read from it)
+_SETTINGS_CACHE = None  # type: typing.Optional[tuple]
 
 
 def get_calendar_setup(settings: calview.settings.FrozenSettings,
-                       password: str) -> caldav.Calendar:
+                       password: str) -> 'caldav.Calendar':
     """Set up connection to `CALDAV_SERVER`` and specifying which
     calendar to query later on.
 
@@ -40,6 +60,8 @@ def get_calendar_setup(settings: calview.settings.FrozenSettings,
         The setup Calendar we want to search later
 
     """
+    # caldav is slow to import and only needed from here on
+    import caldav  # pylint: disable=import-outside-toplevel
     client = caldav.DAVClient(url=settings.server,
                               username=settings.user,
                               password=password)
@@ -48,7 +70,94 @@ def get_calendar_setup(settings: calview.settings.FrozenSettings,
     return my_calendar
 
 
+def _read_settings_file(path: str, section: str) -> typing.Dict[str, str]:
+    """Reads the raw values of `section` from the settings file.
+
+    Only the subset of INI syntax written by calview.__init__ is
+    supported: `[section]` headers, `key = value` (or `key: value`)
+    pairs and full line comments starting with `#` or `;`. Keys are
+    lowercased (as configparser does). The file is decoded as UTF-8,
+    falling back to the locale encoding (which configparser used).
+
+    Args:
+        path: the settings file
+        section: name of the section to read
+
+    Returns:
+        Raw (i.e. not converted) values of `section`, keyed by setting
+
+    Raises:
+        OSError: If the settings file can't be read
+        ValueError: If a line can't be parsed
+
+    """
+    raw = dict()
+    current = None
+    try:
+        with open(path, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+    except UnicodeDecodeError:
+        import locale  # pylint: disable=import-outside-toplevel
+        encoding = locale.getpreferredencoding(False)
+        with open(path, encoding=encoding) as file:
+            lines = file.read().splitlines()
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        match = _SECTION_RE.match(line)
+        if match is not None:
+            current = match.group(1)
+            continue
+        match = _KV_RE.match(line)
+        if match is None:
+            raise ValueError(f'Line {number} is malformed: "{line}"')
+        if current == section:
+            raw[match.group(1).lower()] = match.group(2)
+    return raw
+
+
+def _to_bool(value: str) -> bool:
+    """Converts `value` to bool, accepting what configparser accepts."""
+    if value.lower() not in _BOOLEAN_STATES:
+        raise ValueError(f'Not a boolean: "{value}"')
+    return _BOOLEAN_STATES[value.lower()]
+
+
+# converters for the annotated types of calview.settings.ReadSettings;
+# other types are kept as str
+_CONVERTERS = {bool: _to_bool, int: int}
+
+
 def read_settings() -> calview.settings.ReadSettings:
+    """Reads settings file, if it changed since it was last read.
+
+    The result is cached and reused as long as the modification time
+    of calview.settings.SETTINGS_PATH doesn't change. As callers may
+    change the returned settings, a copy is returned.
+
+    Returns:
+        Preliminary settings(regarding only
+        calview.settings.SETTINGS_PATH)
+
+    Raises:
+        SystemExit: If the settings file can't be read(indirectly via
+        calview.helper.quitter)
+
+    """
+    global _SETTINGS_CACHE  # pylint: disable=global-statement
+    try:
+        mtime = os.stat(calview.settings.SETTINGS_PATH).st_mtime
+    except OSError:
+        # let _read_settings_uncached() handle (and report) it
+        mtime = None
+    if (mtime is None or _SETTINGS_CACHE is None
+            or _SETTINGS_CACHE[0] != mtime):
+        _SETTINGS_CACHE = (mtime, _read_settings_uncached())
+    return copy.copy(_SETTINGS_CACHE[1])
+
+
+def _read_settings_uncached() -> calview.settings.ReadSettings:
     """Reads settings file.
 
     The setting file is : calview.settings.SETTINGS_PATH. Values
@@ -67,31 +176,27 @@ def read_settings() -> calview.settings.ReadSettings:
         calview.helper.quitter)
 
     """
-    out = calview.settings.ReadSettings.get_annotations()
+    out = dict()
     # these are not specified in calview.settings.SETTINGS_PATH
     out['config_dir'] = calview.settings.CONFIG_DIR
     out['settings_file'] = calview.settings.SETTINGS_PATH
     out['template_file'] = calview.settings.TEMPLATE_PATH
-    read_config = configparser.ConfigParser()
     try:
-        read_config.read(calview.settings.SETTINGS_PATH)
-        # section name is the first key of SETTINGS_DEFAULTS
-        section = list(calview.settings.SETTINGS_DEFAULTS.keys())[0]
+        raw = _read_settings_file(calview.settings.SETTINGS_PATH,
+                                  _DEFAULT_SECTION)
         # use the annotated types of calview.settings.ReadSettings
-        # dataclass to call the right method of configparser, to ensure
-        # the correct types of default values (e.g. boolean)
-        for setting, is_type in out.items():
-            callinst = read_config
-            call = callinst.get
-            if isinstance(is_type, type):
-                if is_type == bool:
-                    call = callinst.getboolean
-                if is_type == int:
-                    call = callinst.getint
-                value = call(section, setting)
-                out[setting] = value
+        # dataclass to convert the raw values, to ensure the correct
+        # types of default values (e.g. boolean)
+        annotations = calview.settings.ReadSettings.get_annotations()
+        for setting, is_type in annotations.items():
+            if setting in out:
+                continue
+            if setting not in raw:
+                raise ValueError(f'Missing value: "{setting}"')
+            convert = _CONVERTERS.get(is_type, str)
+            out[setting] = convert(raw[setting])
         return calview.settings.ReadSettings(**out)
-    except configparser.Error as parse_error:
+    except (OSError, ValueError) as parse_error:
         quitmsg = ('Corrupt settings file or missing values. Try removing'
                    f'{out["config_dir"]}, this will setup the directory'
                    ' again with proper default files. Warning: This'
@@ -116,13 +221,11 @@ def _validate(settings: calview.settings.FrozenSettings) -> None:
     """
 
     invalid = list()
+    invalid_append = invalid.append
 
-    for check in calview.validation.SETTINGS_CHECKS:
-        call_check = check[0]
-        invalid_msg = check[1]
+    for call_check, invalid_msg in calview.validation.SETTINGS_CHECKS:
         if call_check(settings):
-            invalid_msg = invalid_msg.format(settings)
-            invalid.append(invalid_msg)
+            invalid_append(invalid_msg.format(settings=settings))
 
     if len(invalid) > 0:
         logging.critical('Wrong configuration')
@@ -138,11 +241,10 @@ def get_configuration(settings: calview.settings.ReadSettings,
                       ) -> calview.settings.FrozenSettings:
     """Get final configuration.
 
-    Manipulate settings and cli args if needed, set or generate some
-    default values. Add some settings(e.g. `settings.language`) and
-    assemble final configuration. Defaults to default locale(see:
-    calview.settings.SETTINGS_DEFAULT) if `settings.lc_all`
-    is not recognised.
+    Apply cli args to settings (without changing `settings`), set or
+    generate some default values. Add some settings (e.g.
+    `settings.language`) and assemble final configuration. The locale
+    is not set here (see: setup_locale()).
 
     Args:
         settings: preliminary settings(as read from
@@ -156,17 +258,30 @@ def get_configuration(settings: calview.settings.ReadSettings,
 
     """
 
-    # setup logging first
+    # collect what the cli args override
+    updates = dict()
     if cli_args['log_to_stdout']:
-        settings.log_to_file = False
+        updates['log_to_file'] = False
     if cli_args['log_file'] is not None:
-        settings.log_file = cli_args['log_file'].strip()
-        settings.log_to_file = True
+        updates['log_file'] = cli_args['log_file']
+        updates['log_to_file'] = True
 
     if cli_args['quiet']:
-        settings.log_level = logging.WARNING
+        updates['log_level'] = logging.WARNING
     if cli_args['debug']:
-        settings.log_level = logging.DEBUG
+        updates['log_level'] = logging.DEBUG
+
+    if cli_args['dry_run']:
+        updates['dry_run'] = True
+
+    if cli_args['output_file'] is not None:
+        updates['output_file'] = cli_args['output_file']
+        updates['output_to_file'] = True
+
+    if updates:
+        # apply all overrides at once (to a copy; `settings` as passed
+        # stays unchanged)
+        settings = dataclasses.replace(settings, **updates)
 
     if setup_logger:
         # this allows early setup of the logger
@@ -175,30 +290,10 @@ def get_configuration(settings: calview.settings.ReadSettings,
         setup_logging(settings, settings_to_log=False)
 
     extra_settings = dict()
-    extra_settings['local_timezone'] = datetime.datetime.now(
-    ).astimezone().tzinfo
-    try:
-        locale.setlocale(locale.LC_ALL, settings.lc_all)
-    except locale.Error as locale_error:
-        logging.debug('Caught: %s', locale_error)
-        logmsg = ('Wrong configuration: Locale: %s'
-                  'is not valid, check: variable "lc_all" in'
-                  f'{settings.settings_file}, variable: "lc_all".')
-        logging.warning(logmsg, settings.lc_all)
-        logmsg = 'Defaulting (lc_all) to: %s'
-        default = list(calview.settings.SETTINGS_DEFAULTS.keys())[0]
-        default = default['lc_all']
-        logging.warning(logmsg, default)
-        locale.setlocale(locale.LC_ALL, default)
+    extra_settings['local_timezone'] = _LOCAL_TZ
+    # the locale itself is set later on (see setup_locale())
     extra_settings['language'] = settings.lc_all.split('.')[0]
 
-    if cli_args['dry_run']:
-        settings.dry_run = True
-
-    if cli_args['output_file'] is not None:
-        settings.output_file = cli_args['output_file'].strip()
-        settings.output_to_file = True
-
     dates = _get_dates(settings, cli_args['start_date'],
                        extra_settings['local_timezone'],
                        cli_args['end_date'])
@@ -208,10 +303,11 @@ def get_configuration(settings: calview.settings.ReadSettings,
     if validate_settings:
         _validate(full_settings)
 
-    if setup_logger:
+    if setup_logger and logging.getLogger().isEnabledFor(logging.DEBUG):
         logging.debug('settings (attribute? value): ')
-        for attribute, value in vars(full_settings).items():
-            logging.debug("%s? %s", attribute, value)
+        for field in dataclasses.fields(full_settings):
+            logging.debug("%s? %s", field.name,
+                          getattr(full_settings, field.name))
 
     return full_settings
 
@@ -238,11 +334,9 @@ def _get_dates(settings: calview.settings.ReadSettings, start_date: str,
     """
     day_span = settings.day_span
     try:
-        start_date = datetime.datetime.strptime(start_date.strip(), '%d%m%Y')
-        start_date = start_date.replace(tzinfo=local_timezone)
+        start_date = _parse_ddmmyyyy(start_date, local_timezone)
         if end_date is not None:
-            end_date = datetime.datetime.strptime(end_date.strip(), '%d%m%Y')
-            end_date = end_date.replace(tzinfo=local_timezone)
+            end_date = _parse_ddmmyyyy(end_date, local_timezone)
         else:
             end_date = start_date + datetime.timedelta(days=day_span)
     except ValueError as malformed_date:
@@ -260,6 +354,30 @@ def _get_dates(settings: calview.settings.ReadSettings, start_date: str,
     return start_date, end_date
 
 
+def _parse_ddmmyyyy(date: str, timezone: datetime.timezone
+                    ) -> datetime.datetime:
+    """Parse a date string (DDMMYYYY).
+
+    This does the same as `datetime.datetime.strptime(date, '%d%m%Y')`
+    for this fixed-width format, without parsing the format string.
+
+    Args:
+        date: date string (DDMMYYYY)
+        timezone: timezone of the returned date
+
+    Returns:
+        The date (at midnight)
+
+    Raises:
+        ValueError: If `date` is malformed
+
+    """
+    if len(date) != 8 or not date.isdigit():
+        raise ValueError(f'"{date}" does not match format DDMMYYYY')
+    return datetime.datetime(int(date[4:8]), int(date[2:4]), int(date[0:2]),
+                             tzinfo=timezone)
+
+
 def setup_logging(settings: calview.settings.ReadSettings,
                   settings_to_log: bool = True) -> None:
     """Setup logging according to settings.
@@ -283,12 +401,60 @@ def setup_logging(settings: calview.settings.ReadSettings,
                             level=settings.log_level)
 
     logging.info('\nstarting\n')
-    if settings_to_log:
+    if settings_to_log and logging.getLogger().isEnabledFor(logging.DEBUG):
         logging.debug('settings (key? value): ')
-        for key, value in vars(settings).items():
+        for key, value in dataclasses.asdict(settings).items():
             logging.debug("%s? %s", key, value)
 
 
+def setup_locale(settings: calview.settings.FrozenSettings
+                 ) -> calview.settings.FrozenSettings:
+    """Set locale according to settings.
+
+    This is only needed for output (i.e. strftime), so it is not done
+    by get_configuration(). Defaults to default locale(see:
+    calview.settings.SETTINGS_DEFAULTS) if `settings.lc_all` is not
+    recognised. Quits with exit code (1), if the default locale isn't
+    recognised either.
+
+    Args:
+        settings: full settings
+
+    Returns:
+        `settings`; if defaulted, a copy with the default `lc_all` (and
+        `language`)
+
+    Raises:
+        SystemExit: If neither `settings.lc_all` nor the default locale
+        are recognised (indirectly via calview.helper.quitter)
+
+    """
+    import locale  # pylint: disable=import-outside-toplevel
+    try:
+        locale.setlocale(locale.LC_ALL, settings.lc_all)
+    except locale.Error as locale_error:
+        logging.debug('Caught: %s', locale_error)
+        logmsg = ('Wrong configuration: Locale: %s '
+                  'is not valid, check: variable "lc_all" in: %s.')
+        logging.warning(logmsg, settings.lc_all, settings.settings_file)
+        logmsg = 'Defaulting (lc_all) to: %s'
+        default = calview.settings.SETTINGS_DEFAULTS[_DEFAULT_SECTION]
+        default = default['lc_all']
+        logging.warning(logmsg, default)
+        try:
+            locale.setlocale(locale.LC_ALL, default)
+        except locale.Error as default_error:
+            logging.debug('Caught: %s', default_error)
+            logmsg = ('Default locale: %s is not available on this system '
+                      'either. Please set variable "lc_all" in: %s to an '
+                      'installed locale. Exiting (1).')
+            logging.critical(logmsg, default, settings.settings_file)
+            calview.helper.quitter(settings, 'Locale not available.')
+        settings = dataclasses.replace(settings, lc_all=default,
+                                       language=default.split('.')[0])
+    return settings
+
+
 def get_password(settings: calview.settings.FrozenSettings) -> str:
     """Get password.
 
@@ -306,6 +472,7 @@ def get_password(settings: calview.settings.FrozenSettings) -> str:
         for password(indirectly via calview.helper.quitter)
 
     """
+    import getpass  # pylint: disable=import-outside-toplevel
     env_name = settings.password_env_variable
     user = settings.user
     password = os.getenv(env_name)
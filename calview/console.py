@@ -6,8 +6,6 @@ See README for usage examples."""
 import logging
 import calview.configuration as cfg
 import calview.cli as cli
-import calview.events as events
-import calview.output as out
 
 
 def main() -> int:
@@ -31,6 +29,13 @@ def main() -> int:
     settings = cfg.get_configuration(default_settings, cli_arguments,
                                      setup_logger=True,
                                      validate_settings=True)
+    settings = cfg.setup_locale(settings)
+
+    # calview.events imports caldav, which is slow to import; so this is
+    # deferred until all settings are known to be valid
+    # pylint: disable=import-outside-toplevel
+    import calview.events as events
+    import calview.output as out
 
     password = cfg.get_password(settings)
     waitmsg = ('Starting. \nThis may take a couple of seconds. Querying '
@@ -8,16 +8,32 @@ Usage:
     plausible_occurences = get_occurences(settings, starting, rrule)
 
 """
+import collections
+import concurrent.futures
 import datetime
 import typing
 import logging
 import dataclasses
-import collections
-import dateutil
+import functools
+import itertools
+import re
+import dateutil.rrule
 import caldav
 import calview.settings
 import calview.helper
 
+# maximum number of events that are saved (marked as seen) at once
+_MAX_SAVE_WORKERS = 8
+# start time of fullday events
+_MIDNIGHT = datetime.time.min
+# matches a STATUS line of raw calendar data, that makes an event
+# skippable (cf. _is_skippable)
+_SKIPPABLE_STATUS_RE = re.compile(
+    r'^STATUS(?:;[^:\r\n]*)?:([^\r\n]*(?:CANCELLED|TENTATIVE)[^\r\n]*)',
+    re.MULTILINE | re.IGNORECASE)
+# matches an UNTIL element of a rrule, that doesn't end with "Z"
+_UNTIL_WITHOUT_Z_RE = re.compile(r'(^|;)(UNTIL[^;]*[^;Z])(?=;|$)')
+
 
 @dataclasses.dataclass
 class Event:
@@ -49,10 +65,11 @@ class Event:
     more: typing.Optional[str]
     status: typing.Optional[str]
     rrule: typing.Optional[str]
+    __slots__ = tuple(__annotations__)
 
 
 def get_events(settings: calview.settings.FrozenSettings,
-               calendar: caldav.Calendar) -> collections.OrderedDict:
+               calendar: caldav.Calendar) -> dict:
     """Get all events.
 
     Reads calendars events, put them in a more useful form, check
@@ -73,26 +90,43 @@ def get_events(settings: calview.settings.FrozenSettings,
     """
 
     events = _get_calendar_events(settings, calendar)
+    if len(events) < 1:
+        logmsg = 'Done! There are no events.'
+        logging.info(logmsg)
+        calview.helper.quitter(settings, logmsg, exit_code=0)
+    mark_recurrent = not settings.dry_run
+    # the log level doesn't change while the events are assembled
+    log_info = logging.getLogger().isEnabledFor(logging.INFO)
+    log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     event_list = list()
-    failed_tries = 0
+    # recurrent events to mark as seen: (Event, caldav_event_data)
+    pending_marks = list()
     for event in events:
+        if _has_skippable_status(event):
+            if log_info:
+                logging.info('Skipping: %s', event.url)
+            continue
+        # the raw data, as sent by the server (kept for a rollback);
+        # once parsed, event.data would serialize the parsed instance
+        ical_data = event.data
         calview_event = _get_constructed_event(
             settings, event)
-        caldav_event_data = dict(calendar=calendar, vevent=event,
-                                 ical_data=event.data)
         if _is_skippable(settings, calview_event):
-            logging.info('Skipping: %s', calview_event.summary)
+            if log_info:
+                logging.info('Skipping: %s', calview_event.summary)
             continue
         # we have a valid event!
         event_list.append(calview_event)
-        logging.debug('Included as valid: %s', calview_event.summary)
+        if log_debug:
+            logging.debug('Included as valid: %s', calview_event.summary)
         # recurent events have  a rrule
-        if calview_event.rrule is not None and not settings.dry_run:
-            success = _mark_event_seen(settings, calview_event,
-                                       caldav_event_data,
-                                       failed_tries)
-            if not success:
-                failed_tries += 1
+        if calview_event.rrule is not None and mark_recurrent:
+            caldav_event_data = dict(calendar=calendar, vevent=event,
+                                     ical_data=ical_data)
+            pending_marks.append((calview_event, caldav_event_data))
+
+    if pending_marks:
+        _mark_events_seen(settings, pending_marks)
 
     if len(event_list) < 1:
         logmsg = 'Done! There are no valid events.'
@@ -114,8 +148,9 @@ def _get_calendar_events(settings: calview.settings.FrozenSettings,
         calendar: the calendar to query
 
     Returns:
-        List of relevant, unloaded events; needs to be interpreted for
-        further use.
+        List of relevant events (including their calendar data, as
+        stored on the server, i.e. recurrent events are not expanded);
+        needs to be interpreted for further use.
 
     Raises:
         SystemExit: If connection can't be established (indirectly via
@@ -123,8 +158,12 @@ def _get_calendar_events(settings: calview.settings.FrozenSettings,
 
     """
     try:
+        # without expand=False, caldav asks the server to expand
+        # recurrent events (if an end is given); the returned instances
+        # have no RRULE, so they'd be treated as single events
         relevant_events = calendar.date_search(start=settings.start_date,
-                                               end=settings.end_date)
+                                               end=settings.end_date,
+                                               expand=False)
     except caldav.lib.error.AuthorizationError as not_authorized:
         logmsg = ('Wrong password / connection settings. Please '
                   'check section [CONNECTION], variable user, '
@@ -148,67 +187,68 @@ def _get_calendar_events(settings: calview.settings.FrozenSettings,
     return relevant_events
 
 
-def _mark_event_seen(settings: calview.settings.FrozenSettings,
-                     event: Event, caldav_event_data: dict,
-                     failed_tries: int) -> bool:
-    """Mark event as as seen by changing its VEVENT.STATUS to settings.
-    have_seen_recurrent.
+def _mark_events_seen(settings: calview.settings.FrozenSettings,
+                      pending_marks: typing.List[typing.Tuple[Event, dict]]
+                      ) -> None:
+    """Mark events as as seen by changing their VEVENT.STATUS to
+    settings.have_seen_recurrent.
 
-    Call this instead of __wrapped_mark_recurrent_event(). This
-    wraps that function and tries to rollback changes if marking goes
-    wrong. In that case, it quits with exit code (1), if the number of
-    repeated fails exceed calview.settings.quit_after_repeated_fails.
+    Call this instead of __wrapped_mark_recurrent_event(). The events
+    are saved concurrently in batches (all using the calendar's client);
+    a batch holds up to _MAX_SAVE_WORKERS events, but never more than
+    may still fail, so no more events are changed than if they were
+    saved one by one. If marking an event goes wrong, a rollback of its
+    changes is tried. Quits with exit code (1), if the number of failed
+    events exceeds settings.quit_after_repeated_fails.
 
     Args:
         settings: full settings
-        event: the event to mark
-        caldav_event_data: dict holding what's neccesary for manipulation
-        of online caldav event. (see: _get_constructed_event for its
-        structure)
-        failed_tries: previously failed tries
-
-    Returns:
-        True: if no error occured. Otherwise: False.
+        pending_marks: the events to mark, each with a dict holding
+        what's neccesary for manipulation of its online caldav event
+        (see: get_events() for its structure)
 
     Raises:
-        SystemExit: If number of repeated fails exceed
+        SystemExit: If number of failed events exceeds
         settings.quit_after_repeated_fails (indirectly via
         calview.helper.quitter)
 
     """
-    dry_run = settings.dry_run
     have_seen = settings.have_seen_recurrent
-    caldav_event = caldav_event_data['vevent']
-    if not dry_run:
-        # if this goes wrong, there may be some non-wanted changes
-        # in the online calendar, so we want to reset changes
-        try:
-            __wrapped_mark_recurrent_event(event, caldav_event, have_seen)
-        # we want to catch it this generally
-        # so that we can ensure a rollback is tried in every
-        # case that may have changed data
-        # pylint: disable=broad-except
-        except Exception as any_exception:
-            logmsg = ('Failed: Marking as recurrent: %s. Data'
-                      ' may have changed. Original exception: %s')
-            logging.warning(logmsg, event.summary, any_exception)
-            _reset_event(event, caldav_event_data)
-            quit_after = settings.quit_after_repeated_fails
-            if failed_tries >= quit_after:
-                logmsg = ('Maximum number (%s/%s) of failed tries'
+    quit_after = settings.quit_after_repeated_fails
+    failed_tries = 0
+    start = 0
+    workers = min(_MAX_SAVE_WORKERS, len(pending_marks))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers
+                                               ) as executor:
+        while start < len(pending_marks):
+            # at most quit_after + 1 failures, as when saving one by one
+            size = max(1, min(workers, quit_after + 1 - failed_tries))
+            batch = pending_marks[start:start + size]
+            start += size
+            futures = [executor.submit(__wrapped_mark_recurrent_event,
+                                       event, caldav_event_data['vevent'],
+                                       have_seen)
+                       for event, caldav_event_data in batch]
+            for (event, caldav_event_data), future in zip(batch, futures):
+                # if this went wrong, there may be some non-wanted changes
+                # in the online calendar, so we want to reset changes
+                any_exception = future.exception()
+                if any_exception is None:
+                    continue
+                # we want to catch it this generally
+                # so that we can ensure a rollback is tried in every
+                # case that may have changed data
+                logmsg = ('Failed: Marking as recurrent: %s. Data'
+                          ' may have changed. Original exception: %s')
+                logging.warning(logmsg, event.summary, any_exception)
+                _reset_event(event, caldav_event_data)
+                failed_tries += 1
+            if failed_tries > quit_after:
+                logmsg = ('Maximum number (%s/%s) of failed tries '
                           'exceeded. Exiting (1).')
                 logging.critical(logmsg, failed_tries, quit_after)
                 quitmsg = 'Marking events as recurrent failed.'
                 calview.helper.quitter(settings, quitmsg)
-            else:
-                return False
-    else:
-        logmsg = ('Dry run: Not changing any data. Event: "%s"'
-                  ' is NOT being  marked as seen (vevent.status)'
-                  ' not changed to "%s" and thus NOT ignored in '
-                  ' future.')
-        logging.warning(logmsg, event.summary, have_seen)
-    return True
 
 
 def __wrapped_mark_recurrent_event(event: Event,
@@ -217,13 +257,12 @@ def __wrapped_mark_recurrent_event(event: Event,
     """Changes VEVENT.STATUS(on the server) to `have_seen`.
 
     If VEVENT.STATUS doesn't exist, it is added. Its better to call
-    _mark_event_seen as that wraps this function (i.e. handling
+    _mark_events_seen as that wraps this function (i.e. handling
     possible errors).
 
     Args:
         caldav_event: the event we need to manipulate
         event: interpreted representation of this VEVENT
-        dry_run: If True, nothing is marked
         have_seen: "CANCELLED" or "TENTATIVE"
 
     """
@@ -244,26 +283,50 @@ def _reset_event(event: Event, caldav_event_data: dict) -> None:
     Args:
         event: the event to reset
         caldav_event_data: dict holding what's neccesary for manipulation
-        of online caldav event. (see: _get_constructed_event() for structure)
+        of online caldav event. (see: get_events() for structure)
 
     """
     calendar = caldav_event_data['calendar']
     caldav_event = caldav_event_data['vevent']
     ical_data = caldav_event_data['ical_data']
     logging.info('Rolling back: %s', event.summary)
-    logging.debug('Using following data for rollback')
-    logging.debug(ical_data)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug('Using following data for rollback')
+        logging.debug(ical_data)
     try:
         caldav_event.delete()
         calendar.add_event(ical_data)
-    # for now, we want to catch all exceptions here
-    # pylint: disable=broad-except
-    except Exception as any_exception:
+    # errors of the server, of the authorization (not a DAVError in
+    # caldav) or the connection (the exceptions of requests, used by
+    # caldav, are OSErrors)
+    except (caldav.lib.error.DAVError, caldav.lib.error.AuthorizationError,
+            OSError) as any_exception:
         logging.warning('Rollback may have failed, for: %s',
                         event.summary)
         logging.warning('Caught: %s', any_exception)
 
 
+def _has_skippable_status(event: caldav.Event) -> bool:
+    """Check the raw calendar data of `event` for a STATUS that makes it
+    skippable (cf. _is_skippable), without parsing it.
+
+    Only used for calendar objects with a single VEVENT; for others,
+    (e.g. with modified occurences) False is returned.
+
+    Args:
+        event: event as returned by _get_calendar_events
+
+    Returns:
+        True: If event is skippable; False: If not or unknown
+
+    """
+    data = event.data
+    if data is None or data.count('BEGIN:VEVENT') != 1:
+        return False
+    # logging is left to the caller (once per skipped event)
+    return _SKIPPABLE_STATUS_RE.search(data) is not None
+
+
 def _get_constructed_event(settings: calview.settings.FrozenSettings,
                            event: caldav.Event) -> Event:
     """ Create instance of Event.
@@ -273,35 +336,32 @@ def _get_constructed_event(settings: calview.settings.FrozenSettings,
 
     Args:
         settings: full settings
-        event: not yet loaded caldav.Event as in the list returned by
-        calview.online:_get_calendar_events
+        event: caldav.Event as in the list returned by
+        _get_calendar_events (with its calendar data, as included in
+        the REPORT of date_search)
 
     Returns:
         Populated instance of Event
 
     """
-    event.load()
-    starting = _get_value(event, 'dtstart')
-    summary = _get_value(event, 'summary')
-    if summary is not None:
-        summary = summary.strip("\n")
+    # parse the calendar data only once
+    vevent = event.instance.vevent
+    starting = _get_value(vevent, 'dtstart')
+    # _get_value strips surrounding whitespace, newlines included
+    summary = _get_value(vevent, 'summary')
     logging.debug('Assembling: %s', summary)
-    location = _get_value(event, 'location')
-    if location is not None:
-        location = location.strip("\n")
-    more = _get_value(event, 'description')
-    status = _get_value(event, 'status')
+    location = _get_value(vevent, 'location')
+    more = _get_value(vevent, 'description')
+    status = _get_value(vevent, 'status')
     # if it is a fullday event, the used caldav library
     # returns it as a `date` object, but we want a uniform
     # `starting` attribute to ease handling
     is_fullday = False
     if not isinstance(starting, datetime.datetime):
-        local_timezone = settings.local_timezone
-        mintime = datetime.datetime.min.time()
-        starting = datetime.datetime.combine(starting, mintime,
-                                             tzinfo=local_timezone)
+        starting = datetime.datetime.combine(
+            starting, _MIDNIGHT, tzinfo=settings.local_timezone)
         is_fullday = True
-    rrule = _get_value(event, 'rrule')
+    rrule = _get_value(vevent, 'rrule')
     if rrule is not None:
         starting = get_next_occurence(settings,
                                       starting, rrule)
@@ -310,15 +370,16 @@ def _get_constructed_event(settings: calview.settings.FrozenSettings,
                  is_fullday, more, status, rrule)
 
 
-def _get_value(event: caldav.Event,
+def _get_value(vevent: typing.Any,
                attribute_name: str) -> typing.Union[str,
                                                     datetime.datetime,
                                                     datetime.date]:
     """Helper function to simplify access to nested
-    Caldav.instance.vevent.{attribute_name}.value
+    vevent.{attribute_name}.value
 
     Args:
-        event: event whose value is wanted
+        vevent: VEVENT component (i.e. Caldav.instance.vevent) whose
+        value is wanted
         attribute_name: the nested attribute, whose value is wanted
 
     Returns:
@@ -327,9 +388,7 @@ def _get_value(event: caldav.Event,
         returned, if the attribute is not there / has no value.
 
     """
-
-    event = event.instance.vevent
-    out = getattr(event, attribute_name, None)
+    out = getattr(vevent, attribute_name, None)
     if out is not None:
         out = getattr(out, 'value', None)
         if attribute_name == 'dtstart':
@@ -340,7 +399,7 @@ def _get_value(event: caldav.Event,
 
 def _get_sorted_events(settings: calview.settings.FrozenSettings,
                        events: typing.List[Event]
-                       ) -> collections.OrderedDict:
+                       ) -> dict:
     """Sort events based on their start time.
 
     Sorts `List[Event]` based on the events start time (Event.starting).
@@ -356,15 +415,81 @@ def _get_sorted_events(settings: calview.settings.FrozenSettings,
         key.
 
     """
-    out = collections.OrderedDict()
+    # dicts (and so defaultdicts) keep their insertion order
+    out = collections.defaultdict(list)
     events.sort(key=lambda x: x.starting)
     day_header = calview.helper.get_template(settings, "day_header")
-    # generate event header (e.g. [Mo, 23.01])
-    for item in events:
-        key = item.starting.strftime(day_header)
-        out[key] = out.get(key, list())
-        out[key].append(item)
-    return out
+    # generate event header (e.g. [Mo, 23.01]) once per day; as the
+    # header may not include the year, different days may share a key
+    for _, day_events in itertools.groupby(events,
+                                           key=lambda x: x.starting.date()):
+        first = next(day_events)
+        day = out[first.starting.strftime(day_header)]
+        day.append(first)
+        day.extend(day_events)
+    return dict(out)
+
+
+def _get_until_in_utc(match: typing.Match) -> str:
+    """Mark an UNTIL element (as matched by _UNTIL_WITHOUT_Z_RE) as UTC.
+
+    A date (without time) is extended to the end of its day, as
+    dateutil only accepts date-times as UTC.
+
+    Args:
+        match: the matched UNTIL element
+
+    Returns:
+        The UNTIL element, ending with "Z"
+
+    """
+    until = match.group(2)
+    if 'T' not in until.partition('=')[2]:
+        until = until + 'T235959'
+    return f'{match.group(1)}{until}Z'
+
+
+@functools.lru_cache(maxsize=256)
+def _get_normalized_rrule(rrule: str) -> str:
+    """Prepare rrule for parsing.
+
+    If UNTIL or COUNT is set, they are regarded. If both are not set,
+    the maximum of generated occurences is set to 20.
+
+    The result is cached, as many events (e.g. of the same series)
+    share their rrule.
+
+    Args:
+        rrule: raw rrule (as in vevent.rrule)
+
+    Returns:
+        The rrule to parse
+
+    """
+    if 'UNTIL' in rrule:
+        # we treat, a bit hacky,
+        # rrule always as timezone-aware as per RFC (2445 p.42)
+        rrule = _UNTIL_WITHOUT_Z_RE.sub(_get_until_in_utc, rrule, count=1)
+    if 'UNTIL' not in rrule and 'COUNT' not in rrule:
+        # limit the numbers of generated occurences
+        rrule = rrule + ";COUNT=20"
+    return rrule
+
+
+def _get_rrule(starting: datetime.datetime,
+               rrule: str) -> dateutil.rrule.rrule:
+    """Parse rrule (cf. _get_normalized_rrule).
+
+    Args:
+        starting: event start time
+        rrule: raw rrule (as in vevent.rrule)
+
+    Returns:
+        The parsed rrule
+
+    """
+    return dateutil.rrule.rrulestr(_get_normalized_rrule(rrule),
+                                   dtstart=starting)
 
 
 def get_occurences(settings: calview.settings.FrozenSettings,
@@ -390,29 +515,14 @@ def get_occurences(settings: calview.settings.FrozenSettings,
     """
     start_date = settings.start_date
     end_date = settings.end_date
-    if 'UNTIL' in rrule:
-        # we treat, a bit hacky,
-        # rrule always as timezone-aware as per RFC (2445 p.42)
-        elements = rrule.split(';')
-        for index, element in enumerate(elements):
-            if element.startswith('UNTIL') and not element.endswith('Z'):
-                elements[index] = element + 'Z'
-                break
-        rrule = ';'.join(elements)
-    if 'UNTIL' not in rrule and 'COUNT' not in rrule:
-        # limit the numbers of generated occurences
-        rrule = rrule + ";COUNT=20"
-    rrule = dateutil.rrule.rrulestr(rrule, dtstart=starting)
+    rrule = _get_rrule(starting, rrule)
 
-    # pylint: disable=multiple-statements
-    # this is more readable than lambda
-    def include(occurence): return start_date <= occurence <= end_date
+    # only generate the occurences we want (instead of all and filtering
+    # them afterwards)
     if include_after_end_date:
-        # pylint: disable=function-redefined
-        def include(occurence): return start_date <= occurence
-
-    occurences = [occurence for occurence in list(rrule)
-                  if include(occurence)]
+        occurences = list(rrule.xafter(start_date, inc=True))
+    else:
+        occurences = rrule.between(start_date, end_date, inc=True)
     if len(occurences) == 0:
         return None
     return occurences
@@ -423,21 +533,24 @@ def get_next_occurence(settings: calview.settings.FrozenSettings,
                        rrule: str) -> typing.Optional[datetime.datetime]:
     """Generate the next occurent of event based on its rrule.
 
+    This is the first occurence within settings.start_date and
+    settings.end_date (cf. get_occurences); only this one is generated.
+
     Args:
         settings: full settings
+        starting: event start time
         rrule: recurrence rule (vevent.rrule)
 
     Returns:
         If found, next occurence is returned; otherwise None.
 
     """
-    occurences = get_occurences(settings, starting, rrule)
-    if occurences is None:
+    next_occurence = _get_rrule(starting, rrule).after(settings.start_date,
+                                                       inc=True)
+    if next_occurence is None or next_occurence > settings.end_date:
         logmsg = "Couldn't find any occurences. Rrule: %s"
         logging.debug(logmsg, rrule)
         return None
-    start_date = settings.start_date
-    next_occurence = min(occurences, key=lambda x: abs(x - start_date))
     logmsg = 'Generated next occurence: (%s). Rrule: %s'
     logging.debug(logmsg, next_occurence, rrule)
     return next_occurence
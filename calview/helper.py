@@ -78,6 +78,11 @@ def get_template(settings: typing.Union[calview.settings.ReadSettings,
     """
     language = settings.language
     templates = calview.templates.templates
+    # usual case: both are there
+    try:
+        return templates[language][key]
+    except KeyError:
+        pass
     if language not in templates:
         logmsg = "Didn't find templates for language: %s. Exiting."
         logging.critical(logmsg, language)
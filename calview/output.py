@@ -9,14 +9,13 @@ Usage:
 
 """
 
-import collections
 import logging
+import sys
 import typing
 import calview.events
 import calview.settings
 import calview.helper
 
-
 def put_out(settings: calview.settings.FrozenSettings, output: str) -> None:
     """Print or write final output.
 
@@ -30,11 +29,13 @@ def put_out(settings: calview.settings.FrozenSettings, output: str) -> None:
         with open(settings.output_file, 'w') as output_file:
             output_file.write(output)
     else:
-        print(output)
+        # the same as print(output)
+        sys.stdout.write(output)
+        sys.stdout.write('\n')
 
 
 def get_output(settings: calview.settings.FrozenSettings,
-               events: collections.OrderedDict) -> str:
+               events: dict) -> str:
     """Assembles final output.
 
     Args:
@@ -44,18 +45,70 @@ def get_output(settings: calview.settings.FrozenSettings,
     Returns:
         Output
     """
-    single, recurrent = _render_events(settings, events)
+    templates = _EventTemplates(settings)
+    # rendered rrules by (rrule, starting); cf. _render_recurrent
+    rrule_cache = dict()
+    single, recurrent = _render_events(settings, templates, rrule_cache,
+                                       events)
     output = _render_output(settings, single, recurrent)
     return output
 
 
+class _EventTemplates(dict):
+    """Templates needed to render events, by name.
+
+    Every template is looked up (via calview.helper.get_template) once
+    per output, when it is first used; so a template that isn't needed
+    (e.g. for recurrent events, if there are none) can't make calview
+    quit.
+
+    Additionally holds `event_more_item_join`: separator of the lines
+    of Event.more (based on `event_more_item_sep`).
+
+    """
+
+    def __init__(self: '_EventTemplates',
+                 settings: calview.settings.FrozenSettings) -> None:
+        """
+        Args:
+            settings: full settings
+
+        """
+        super().__init__()
+        self.settings = settings
+
+    def __missing__(self: '_EventTemplates', key: str) -> typing.Any:
+        """Look up the template `key`.
+
+        Args:
+            key: template name (e.g `event_single`)
+
+        Returns:
+            Template
+
+        Raises:
+            SystemExit: If the template is not found (indirectly via
+            calview.helper.quitter).
+
+        """
+        if key == 'event_more_item_join':
+            value = f"\n{self['event_more_item_sep']} "
+        else:
+            value = calview.helper.get_template(self.settings, key)
+        self[key] = value
+        return value
+
+
 def _render_events(settings: calview.settings.FrozenSettings,
+                   templates: dict, rrule_cache: dict,
                    event_dict: dict) -> tuple:
     """
     Render all events.
 
     Args:
         settings: full settings
+        templates: cf. _EventTemplates
+        rrule_cache: rendered rrules (cf. _render_recurrent)
         event_dict: sorted events
 
     Returns:
@@ -64,31 +117,25 @@ def _render_events(settings: calview.settings.FrozenSettings,
             (2) All recurrent events rendered as one string.
 
     """
-    events = collections.OrderedDict()
-    recurrent = collections.OrderedDict()
+    parts_events = list()
+    parts_recurrent = list()
     for header, listed_events in event_dict.items():
-        events[header] = list()
-        recurrent[header] = list()
+        events = list()
+        recurrent = list()
         for event in listed_events:
             if event.rrule is None:
-                single = _render_single(settings, event)
-                events[header].append(single)
+                events.append(_render_single(templates, event))
             else:
-                recc = _render_recurrent(settings, event)
-                recurrent[header].append(recc)
-    out_events = ''
-    out_recurrent = ''
-    for header, listed_events in events.items():
-        if len(listed_events) < 1:
-            continue
-        out_events = out_events + \
-            header + '\n'.join(listed_events)
-    for header, listed_events in recurrent.items():
-        if len(listed_events) < 1:
-            continue
-        out_recurrent = out_recurrent + \
-            header + '\n'.join(listed_events)
-    return out_events, out_recurrent
+                recurrent.append(_render_recurrent(settings, templates,
+                                                   rrule_cache, event))
+        # headers of days without (single / recurrent) events are left out
+        if events:
+            parts_events.append(header)
+            parts_events.append('\n'.join(events))
+        if recurrent:
+            parts_recurrent.append(header)
+            parts_recurrent.append('\n'.join(recurrent))
+    return ''.join(parts_events), ''.join(parts_recurrent)
 
 
 def _render_output(settings: calview.settings.FrozenSettings, events: str,
@@ -104,11 +151,12 @@ def _render_output(settings: calview.settings.FrozenSettings, events: str,
         Rendered events in final template in one string.
 
     """
-    full = calview.helper.get_template(settings, 'full')
-    without_recc = calview.helper.get_template(settings, 'full_without_recc')
-
-    if len(recurrent) < 1:
+    # only look up the template that is used
+    if not recurrent:
+        without_recc = calview.helper.get_template(settings,
+                                                   'full_without_recc')
         return without_recc.format(events=events)
+    full = calview.helper.get_template(settings, 'full')
     return full.format(events=events, recurrent=recurrent)
 
 
@@ -116,7 +164,9 @@ def _render_output(settings: calview.settings.FrozenSettings, events: str,
 # it relies on contextual informations in the output format; they
 # should be comprehensible as one stand-alone sentence.
 def _render_rrule(settings: calview.settings.FrozenSettings,
-                  event: calview.events.Event) -> typing.Union[str, dict]:
+                  templates: dict,
+                  event: calview.events.Event
+                  ) -> typing.Tuple[str, typing.Optional[str]]:
     """Translates rrule to settings.language (with a very limited
     support of rrule's elements).
 
@@ -125,13 +175,15 @@ def _render_rrule(settings: calview.settings.FrozenSettings,
 
     Args:
         settings: full settings
+        templates: cf. _EventTemplates
         event: the recurrent calview event to render
 
     Returns:
-        The translation (if successfull, otherwise the raw rrule string);
-        if additional information is added (e. g. the next occurences)
-        a dict is returned (keys: "translation", "additional");
-        otherwise a string is returned
+        Tuple with the following elements:
+            (1) The translation (if successfull, otherwise the raw
+            rrule string)
+            (2) Additional information (e. g. the next occurences), if
+            there is any; otherwise None
 
     Todo:
         (1): The translation isn't working very well right now and not
@@ -145,17 +197,17 @@ def _render_rrule(settings: calview.settings.FrozenSettings,
         for any proper translation.
 
     """
-    rrule = event.rrule
-    rrule = (rule.lower().split('=') for rule in rrule.split(";"))
-    rrule = {rule[0]: rule[1] for rule in rrule}
+    # "key=value" -> (key, value)
+    rrule = dict(rule.partition('=')[::2]
+                 for rule in event.rrule.lower().split(';'))
     where = 'singular'
     translation = ""
+    additional = None
     if 'interval' in rrule and int(rrule['interval']) > 1:
         where = 'plural'
         recurrance = rrule['interval']
     if 'freq' in rrule:
-        translation_map = calview.helper.get_template(
-            settings, 'rrule_translation_map')
+        translation_map = templates['rrule_translation_map']
         translation = translation_map[where][rrule['freq']]
         if where == 'plural':
             # e.g: every {interval} days
@@ -166,36 +218,35 @@ def _render_rrule(settings: calview.settings.FrozenSettings,
                                                        event.rrule,
                                                        include_after_end_date=True)
             # occurence includes the original event
-            # so a (valid) repetition is only: len(occurences)+1
-            if occurences is not None and len(occurences) > 1:
-                translation = dict(frequence=translation)
-                day_format = calview.helper.get_template(
-                    settings, 'day_format')
+            # so a (valid) repetition is only: len(occurences)-1;
+            # get_occurences returns a list, so len / indexing are cheap
+            repeat_times = 0
+            if occurences is not None:
                 repeat_times = len(occurences) - 1
+            if repeat_times > 0:
+                day_format = templates['day_format']
                 if repeat_times == 1:
                     date = occurences[1].strftime(day_format)
                     repeat = translation_map['limited_repeat']['once']
-                    repeat = repeat.format(date)
-                    translation['additional'] = repeat
+                    additional = repeat.format(date)
                 else:
                     last = occurences[-1].strftime(day_format)
                     howmany = 'many'
                     if repeat_times <= 3:
                         howmany = 'few'
                     repeat = translation_map['limited_repeat'][howmany]
-                    repeat = repeat.format(last)
-                    translation['additional'] = repeat
+                    additional = repeat.format(last)
         logmsg = 'Tried a translation for: "%s", check rrule: %s.'
         logging.info(logmsg, event.summary, event.rrule)
-    if len(translation) > 0:
-        return translation
+    if translation:
+        return translation, additional
     logmsg = ('Translation failed (occurence frequence) for: "%s". '
               'Including raw rrule string in output.')
     logging.warning(logmsg, event.summary)
-    return event.rrule
+    return event.rrule, None
 
 
-def _render_starttime(settings: calview.settings.FrozenSettings,
+def _render_starttime(templates: dict,
                       event: calview.events.Event) -> str:
     """
     Renders starttime of an event.
@@ -204,7 +255,7 @@ def _render_starttime(settings: calview.settings.FrozenSettings,
     or `starting_time` respectivly.
 
     Args:
-        settings: full settings
+        templates: cf. _EventTemplates
         event: event whose start time should be rendered
 
     Returns:
@@ -212,14 +263,14 @@ def _render_starttime(settings: calview.settings.FrozenSettings,
 
     """
     if event.is_fullday:
-        out = calview.helper.get_template(settings, 'starting_fullday')
+        out = templates['starting_fullday']
     else:
-        out_date = calview.helper.get_template(settings, 'starting_time')
-        out = event.starting.strftime(out_date)
+        out = event.starting.strftime(templates['starting_time'])
     return out
 
 
 def _render_recurrent(settings: calview.settings.FrozenSettings,
+                      templates: dict, rrule_cache: dict,
                       event: calview.events.Event) -> str:
     """Renders recurrent event to str.
 
@@ -228,58 +279,60 @@ def _render_recurrent(settings: calview.settings.FrozenSettings,
 
     Args:
         * settings: full settings
+        * templates: cf. _EventTemplates
+        * rrule_cache: rendered rrules (as returned by _render_rrule)
+        by (Event.rrule, Event.starting); events sharing both are
+        rendered only once
         * event: event whose start time should be rendered
 
     Returns:
         * out: rendered event
 
     """
-    recurrent = calview.helper.get_template(settings, 'event_reccurent')
-    more = calview.helper.get_template(settings, 'event_more')
-    epilog = calview.helper.get_template(settings, 'event_epilog')
-    start = _render_starttime(settings, event)
-    frequence = _render_rrule(settings, event)
+    recurrent = templates['event_reccurent']
+    start = _render_starttime(templates, event)
+    rrule_key = (event.rrule, event.starting)
+    rendered_rrule = rrule_cache.get(rrule_key)
+    if rendered_rrule is None:
+        rendered_rrule = _render_rrule(settings, templates, event)
+        rrule_cache[rrule_key] = rendered_rrule
+    frequence, additional = rendered_rrule
     format_args = dict(frequence=frequence, starting=start,
                        summary=event.summary, location=event.location)
-    if isinstance(frequence, dict):
-        recc_added = 'event_reccurent_occurences_added'
-        recurrent = calview.helper.get_template(settings, recc_added)
-        format_args['additional'] = frequence['additional']
-        format_args['frequence'] = frequence['frequence']
+    if additional is not None:
+        recurrent = templates['event_reccurent_occurences_added']
+        format_args['additional'] = additional
     out = recurrent.format(**format_args)
     if event.more is not None:
-        sep = calview.helper.get_template(settings, 'event_more_item_sep')
-        text = f'\n{sep} '.join(event.more.strip().split('\n'))
-        out = out + more.format(text=text)
-    out = out + epilog
+        sep = templates['event_more_item_join']
+        text = sep.join(event.more.splitlines())
+        out = out + templates['event_more'].format(text=text)
+    out = out + templates['event_epilog']
     return out
 
 
-def _render_single(settings: calview.settings.FrozenSettings,
-                   event: calview.events.Event) -> str:
+def _render_single(templates: dict, event: calview.events.Event) -> str:
     """Renders single event to str.
 
     This is done according to `event_single`, `event_more`,
     `event_epilog` templates defined in calview.templates.
 
     Args:
-    settings: full settings
+    templates: cf. _EventTemplates
     event: event whose start time should be rendered
 
     Returns:
         Rendered event
 
     """
-    single = calview.helper.get_template(settings, 'event_single')
-    more = calview.helper.get_template(settings, 'event_more')
-    epilog = calview.helper.get_template(settings, 'event_epilog')
-    start = _render_starttime(settings, event)
+    single = templates['event_single']
+    start = _render_starttime(templates, event)
     out = single.format(
         starting=start,
         summary=event.summary,
         location=event.location)
     if event.more is not None:
-        text = '\n** '.join(event.more.strip().split('\n'))
-        out = out + more.format(text=text)
-    out = out + epilog
+        text = '\n** '.join(event.more.splitlines())
+        out = out + templates['event_more'].format(text=text)
+    out = out + templates['event_epilog']
     return out
@@ -11,13 +11,13 @@
         * SETTINGS_HELPMSG
         * CLI_DESCRIPTION
         * SETTINGS_DEFAULTS
+        * SETTINGS_DEFAULT_TEXT
         * CLI_OPTIONS
 
 """
 import dataclasses
 import datetime
 import os
-import collections
 from calview.connection import CONNECTION
 
 # GLOBAL CONSTANTS
@@ -68,6 +68,29 @@ class FrozenSettings:
     local_timezone: datetime.timezone
     start_date: datetime.datetime
     end_date: datetime.datetime
+    # no per-instance __dict__; possible as no attribute has a default
+    __slots__ = tuple(__annotations__)
+
+    # as the instance is frozen, copy / pickle can't restore the slots
+    # via setattr (this is what dataclass(slots=True) does since 3.10)
+    def __getstate__(self: 'FrozenSettings') -> tuple:
+        """Get the state to copy / pickle.
+
+        Returns:
+            All attribute values, in the order of __slots__
+
+        """
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self: 'FrozenSettings', state: tuple) -> None:
+        """Restore a copied / unpickled state.
+
+        Args:
+            state: as returned by __getstate__
+
+        """
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 @dataclasses.dataclass
@@ -94,6 +117,7 @@ class ReadSettings:
     user: str
     server: str
     cal_url: str
+    __slots__ = tuple(__annotations__)
 
     def get_as_frozen(self: 'ReadSettings', **additional_attributes
                       ) -> FrozenSettings:
@@ -102,14 +126,19 @@ class ReadSettings:
 
         Args:
             additional_attributes: keyword/value pair(s) that corresponds
-            to attributes not present in ReadSettings but present in FrozenSettings
+            to attributes not present in ReadSettings but present in
+            FrozenSettings; or to attributes of ReadSettings, whose
+            value should be overridden
 
         Returns:
             New instance of FrozenSettings with all attribute values
             of ReadSettings plus keyword expanded `additional_attributes`
 
         """
-        return FrozenSettings(**vars(self), **additional_attributes)
+        attributes = {field.name: getattr(self, field.name)
+                      for field in dataclasses.fields(self)}
+        attributes.update(additional_attributes)
+        return FrozenSettings(**attributes)
 
     @classmethod
     def get_annotations(cls: 'ReadSettings') -> dict:
@@ -133,47 +162,43 @@ SETTINGS_HELPMSG = """# All values must be set.
 # Please see README for further information.\n"""
 
 
-def _get_default_settings() -> dict:
-    """Returns default settings.
-
-    The keys of SETTINGS_DEFAULTS['SETTINGS'] refer to to `ReadSettings`
-    attributes. More than one section (more than keyword in
-    SETTINGS_DEFAULTS' first level) is not supported.
-
-    Returns:
-        Dictionary holding the default values
-
-    """
-    settings_defaults = collections.OrderedDict(
-        # section name of configuration file
-        SETTINGS=collections.OrderedDict(
-            lc_all='de_DE.UTF-8',  # used for language
-            dry_run=False,  # see calviewer -h
-            output_file='output.txt',  # see calviewer -h
-            output_to_file=False,  # see calviewer -h
-            log_to_file=False,  # see calviewer -h
-            # see calviewer -h
-            log_file=str(os.path.join(CONFIG_DIR, 'output.log')),
-            log_level=20,  # see calviewer -h
-            # if end date is not passed as cli arg: end date = start date + day span
-            day_span=14,
-            # quit if so many tries have failed to mark event as seen
-            quit_after_repeated_fails=2,
-            # if False, error messages will only be logged
-            print_message_if_unexcepted_quit=True,
-            # status with which seen, recurrent events are marked
-            have_seen_recurrent='TENTATIVE',  # or: CANCELLED
-            user=CONNECTION['user'],
-            server=CONNECTION['server'],
-            password_env_variable='CALVIEW_PASS',
-            cal_url=CONNECTION['cal_url']
-        )
-    )
-
-    return settings_defaults
-
-
-SETTINGS_DEFAULTS = _get_default_settings()
+# default settings
+# The keys of SETTINGS_DEFAULTS['SETTINGS'] refer to to `ReadSettings`
+# attributes. More than one section (more than keyword in
+# SETTINGS_DEFAULTS' first level) is not supported.
+SETTINGS_DEFAULTS = {
+    # section name of configuration file
+    'SETTINGS': {
+        'lc_all': 'de_DE.UTF-8',  # used for language
+        'dry_run': False,  # see calviewer -h
+        'output_file': 'output.txt',  # see calviewer -h
+        'output_to_file': False,  # see calviewer -h
+        'log_to_file': False,  # see calviewer -h
+        # see calviewer -h
+        'log_file': str(os.path.join(CONFIG_DIR, 'output.log')),
+        'log_level': 20,  # see calviewer -h
+        # if end date is not passed as cli arg: end date = start date + day span
+        'day_span': 14,
+        # quit if so many tries have failed to mark event as seen
+        'quit_after_repeated_fails': 2,
+        # if False, error messages will only be logged
+        'print_message_if_unexcepted_quit': True,
+        # status with which seen, recurrent events are marked
+        'have_seen_recurrent': 'TENTATIVE',  # or: CANCELLED
+        'user': CONNECTION['user'],
+        'server': CONNECTION['server'],
+        'password_env_variable': 'CALVIEW_PASS',
+        'cal_url': CONNECTION['cal_url'],
+    },
+}
+
+# SETTINGS_DEFAULTS as written to the settings file (INI format, as by
+# configparser.ConfigParser.write)
+SETTINGS_DEFAULT_TEXT = ''.join(
+    f'[{section}]\n'
+    + ''.join(f'{key} = {value}\n' for key, value in options.items())
+    + '\n'
+    for section, options in SETTINGS_DEFAULTS.items())
 
 # CLI settings
 
@@ -185,74 +210,54 @@ CLI_DESCRIPTION = ('Generate view on calendar. \n Set default values '
                    ' formatting in {settings.template_file}')
 
 
-def _get_cli_options() -> list:
-    """Returns cli configuration.
-
-    Returns:
-        A list of lists, where the items of the second list are:
-            * a list: passed as first argument to
-            argparser.ArgParser.add_argument
-            * a dictionary: passed via keyword expansion as additional
-            arguments
-                * if it contains key `help`, its value may be formatted
-                with reference to `settings` (ReadSettings)
-
-    """
-
-    helpmsg = ('Format: DDMMYYYY. \n View includes events from '
-               'this date until end date.')
-    options = dict(help=helpmsg)
-    command = ['start_date']
-    start_date = [command, options]
-
-    helpmsg = ('Format: DDMMYYYY. \n Default: End date will be '
-               'calculated based on DAY_SPAN ({settings.day_span})'
-               ' + START_DATE')
-    command = ['-e', '--end_date']
-    options = dict(required=False, help=helpmsg)
-    end_date = [command, options]
-
-    helpmsg = ('Write output to OUTPUT_FILE. Filemode: "w". Default: '
-               '{settings.output_file}.')
-    options = dict(required=False, help=helpmsg)
-    command = ['-o', '--output_file']
-    output_file = [command, options]
-
-    helpmsg = ('Write log to LOG_FILE. Filemode: "a". Default: '
-               '{settings.log_file}.')
-    options = dict(required=False, help=helpmsg)
-    command = ['-l', '--log_file']
-    log_file = [command, options]
-
-    helpmsg = ('Write log to STDOUT. Notice: If set, this overrides '
-               '"--log-file". Default: log_to_file={settings.log_to_file}')
-    options = dict(required=False, help=helpmsg, action='store_true')
-    command = ['-s', '--log_to_stdout']
-    log_to = [command, options]
-
-    helpmsg = ('Set logs level to: "warning (30)". Default '
-               '(higher=less logging): {settings.log_level}.')
-    options = dict(required=False, help=helpmsg, action='store_true')
-    command = ['-q', '--quiet']
-    quiet = [command, options]
-
-    helpmsg = ("Don't change any data in calDAV calendar. If not set, "
-               'recurrent events are marked to be ignored in future runs. '
-               'Default: {settings.dry_run}.')
-    options = dict(required=False, help=helpmsg, action='store_true')
-    command = ['-d', '--dry_run']
-    dry_run = [command, options]
-
-    helpmsg = ('Set logs level to: "debug (10)". Default '
-               '(lower=more logging): {settings.log_level}.')
-    options = dict(required=False, help=helpmsg, action='store_true')
-    command = ['-b', '--debug']
-    debug = [command, options]
-
-    cli_options = [start_date, end_date, output_file, log_file,
-                   log_to, quiet, dry_run, debug]
-
-    return cli_options
-
-
-CLI_OPTIONS = _get_cli_options()
+# cli configuration
+# A tuple of tuples, where the items of the inner tuples are:
+#   * a tuple: passed as positional arguments to
+#   argparser.ArgParser.add_argument
+#   * a dictionary: passed via keyword expansion as additional
+#   arguments
+#       * if it contains key `help`, its value may be formatted
+#       with reference to `settings` (ReadSettings)
+CLI_OPTIONS = (
+    (('start_date',),
+     dict(help=('Format: DDMMYYYY. \n View includes events from '
+                'this date until end date.'),
+          type=str.strip)),
+    (('-e', '--end_date'),
+     dict(required=False,
+          help=('Format: DDMMYYYY. \n Default: End date will be '
+                'calculated based on DAY_SPAN ({settings.day_span})'
+                ' + START_DATE'),
+          type=str.strip)),
+    (('-o', '--output_file'),
+     dict(required=False,
+          help=('Write output to OUTPUT_FILE. Filemode: "w". Default: '
+                '{settings.output_file}.'),
+          type=str.strip)),
+    (('-l', '--log_file'),
+     dict(required=False,
+          help=('Write log to LOG_FILE. Filemode: "a". Default: '
+                '{settings.log_file}.'),
+          type=str.strip)),
+    (('-s', '--log_to_stdout'),
+     dict(required=False,
+          help=('Write log to STDOUT. Notice: If set, this overrides '
+                '"--log-file". Default: log_to_file={settings.log_to_file}'),
+          action='store_true')),
+    (('-q', '--quiet'),
+     dict(required=False,
+          help=('Set logs level to: "warning (30)". Default '
+                '(higher=less logging): {settings.log_level}.'),
+          action='store_true')),
+    (('-d', '--dry_run'),
+     dict(required=False,
+          help=("Don't change any data in calDAV calendar. If not set, "
+                'recurrent events are marked to be ignored in future runs. '
+                'Default: {settings.dry_run}.'),
+          action='store_true')),
+    (('-b', '--debug'),
+     dict(required=False,
+          help=('Set logs level to: "debug (10)". Default '
+                '(lower=more logging): {settings.log_level}.'),
+          action='store_true')),
+)
@@ -16,8 +16,11 @@ import calview.settings
 
 # CLI_CHECKS
 
+# the only characters allowed in cli dates
+_DIGITS = frozenset('0123456789')
 
-def _get_cli_checks() -> list:
+
+def _get_cli_checks() -> tuple:
     """
     Returns validation checks for checking command line arguments.
 
@@ -31,7 +34,7 @@ def _get_cli_checks() -> list:
         * if set, has cli_args['end_date'] only numbers in it?
 
     Returns:
-        A lists of list, where the second list has two
+        A tuple of tuples, where the inner tuples have two
         kind of items:
             * callable: function to call (full cli_args as parameter)
             * str: helpmsg (formattable with keyword expaned cli_args)
@@ -67,12 +70,8 @@ def _get_cli_checks() -> list:
 
     def _helper_illegal_chars(cli_args: dict, key: str) -> bool:
         ''' Returns True if `key` in `cli_args` has illegal chars'''
-        allowed_chars = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')
-        has_illegal_chars = (True for char in str(cli_args[key])
-                             if char not in allowed_chars)
-        if any(has_illegal_chars):
-            return True
-        return False
+        # not str.isdigit: it accepts non-ASCII digits, too
+        return not _DIGITS.issuperset(str(cli_args[key]))
 
     def illegalchars_start_date(cli_args: dict) -> bool:
         '''Returns True if end_date has invalid characters'''
@@ -105,15 +104,14 @@ def _get_cli_checks() -> list:
                                  '"{end_date}". Please use characters: 0-9'
                                  '. Example: 01012020.')
 
-    cli_checks = [
-        [no_quiet_and_debug, no_quiet_and_debug_msg],
-        [ambigious__log_dest, ambigious__log_dest_msg],
-        [invalid_start_date_length, invalid_start_date_length_msg],
-        [invalid_start_date_length, invalid_start_date_length_msg],
-        [invalid_end_date_length, invalid_end_date_length_msg],
-        [illegalchars_start_date, illegalchars_start_date_msg],
-        [illegalchars_end_date, illegalchars_end_date_msg]
-    ]
+    cli_checks = (
+        (no_quiet_and_debug, no_quiet_and_debug_msg),
+        (ambigious__log_dest, ambigious__log_dest_msg),
+        (invalid_start_date_length, invalid_start_date_length_msg),
+        (invalid_end_date_length, invalid_end_date_length_msg),
+        (illegalchars_start_date, illegalchars_start_date_msg),
+        (illegalchars_end_date, illegalchars_end_date_msg)
+    )
     return cli_checks
 
 
@@ -122,7 +120,7 @@ CLI_CHECKS = _get_cli_checks()
 # SETTINGS_CHECKS
 
 
-def _get_settings_check() -> list:
+def _get_settings_check() -> tuple:
     """
     Returns validation checks for checking FrozenSettings instance.
 
@@ -133,7 +131,7 @@ def _get_settings_check() -> list:
         * are there templates for `settings.language`?
 
     Returns:
-        A lists of list, where the second list has two
+        A tuple of tuples, where the inner tuples have two
         kind of items:
             * callable: function to call (called w/ FrozenSettings
             instance as parameter)
@@ -164,11 +162,11 @@ def _get_settings_check() -> list:
                             '"{settings.language}" is not supported, check:'
                             'variable: "lc_all" in: {settings.settings_file} .')
 
-    settings_checks = [
-        [invalid_have_seen, invalid_have_seen_msg],
-        [invalid_end_date, invalid_end_date_msg],
-        [invalid_language, invalid_language_msg]
-    ]
+    settings_checks = (
+        (invalid_have_seen, invalid_have_seen_msg),
+        (invalid_end_date, invalid_end_date_msg),
+        (invalid_language, invalid_language_msg)
+    )
 
     return settings_checks
 